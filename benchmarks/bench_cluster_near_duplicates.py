@@ -0,0 +1,65 @@
+"""
+Benchmark near-duplicate clustering on a synthetic dump where half of the posts
+are lightly edited reposts.
+
+Run with `poetry run python benchmarks/bench_cluster_near_duplicates.py [posts]`.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from post_roulette.lib import cluster_near_duplicates
+
+
+def make_contents(count: int) -> list:
+    rng = random.Random(0)
+    vocabulary = [f"word{index}" for index in range(5000)]
+    originals = [" ".join(rng.choices(vocabulary, k=30)) for _ in range(count // 2)]
+
+    contents = []
+    for index in range(count):
+        if index % 2 == 0:
+            contents.append(originals[index // 2])
+        else:
+            words = rng.choice(originals).split()
+            words[rng.randrange(len(words))] = "edited"
+            contents.append(" ".join(words))
+
+    return contents
+
+
+def timed(label: str, fn) -> None:
+    start = time.perf_counter()
+    clusters = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24}{elapsed:>8.3f}s  {len(set(clusters))} clusters")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    workers = os.cpu_count() or 1
+    contents = make_contents(count)
+
+    print(f"{count} posts, {count // 2} originals")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        timed(
+            "1 worker, cold cache",
+            lambda: cluster_near_duplicates("bench", contents, 1, cache_dir),
+        )
+        timed(
+            "1 worker, warm cache",
+            lambda: cluster_near_duplicates("bench", contents, 1, cache_dir),
+        )
+
+    if workers > 1:
+        timed(
+            f"{workers} workers, no cache",
+            lambda: cluster_near_duplicates("bench", contents, workers, None),
+        )
+
+
+if __name__ == "__main__":
+    main()
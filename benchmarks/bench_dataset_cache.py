@@ -0,0 +1,60 @@
+"""
+Benchmark switching between sources thru the dataset cache, with two synthetic
+FB dumps in a temporary directory.
+
+Run with `poetry run python benchmarks/bench_dataset_cache.py [posts per source]`.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+from post_roulette.lib import DatasetCache
+from post_roulette.types import SourceConfig
+
+SOURCE_CONFIGS = {
+    name: SourceConfig(
+        name=name, mapper_function_name="facebook_mapper", data_file_name=f"{name}.json"
+    )
+    for name in ["first", "second"]
+}
+
+
+def timed(label: str, fn) -> None:
+    start = time.perf_counter()
+    fn()
+    print(f"{label:<36}{time.perf_counter() - start:>10.6f}s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        os.mkdir("data")
+        for name in SOURCE_CONFIGS:
+            rows = [
+                {"timestamp": 1500000000 + index, "data": [{"post": f"{name} {index}"}]}
+                for index in range(count)
+            ]
+            with open(f"data/{name}.json", "w") as f:
+                json.dump(rows, f)
+
+        print(f"{count} posts per source")
+
+        roomy = DatasetCache(SOURCE_CONFIGS, 2**40, "./cache")
+        timed("load first from dump", lambda: roomy.get("first"))
+        timed("load second from dump", lambda: roomy.get("second"))
+        timed("switch between loaded sources", lambda: roomy.get("first"))
+
+        # a budget that only fits one source, so every switch evicts the other
+        tight = DatasetCache(SOURCE_CONFIGS, 1, "./cache")
+        tight.get("first")
+        timed("switch, mapping dump and evicting", lambda: tight.get("second"))
+        timed("switch, loading from snapshot", lambda: tight.get("first"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark compiled mapper specs against interpreted path lookups and the
+hand-written `facebook_mapper`, end to end and with date formatting stubbed out,
+as it takes most of the mapping time and hides the cost of the lookups.
+
+Run with `poetry run python benchmarks/bench_mapper_spec.py [rows]`.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from post_roulette.lib import (
+    compile_mapper_spec,
+    pretty_date_from_epoch_time,
+    repair_mojibake,
+)
+from post_roulette.mappers.facebook_mapper import facebook_mapper
+from post_roulette.types import MapperSpec, MapRowToPost, PostData
+
+# spec equivalent of `facebook_mapper`
+FB_SPEC = MapperSpec(
+    content_paths=["data.0.post"], timestamp_paths=["timestamp"], repair_text=True
+)
+
+
+def interpret_mapper_spec(spec: MapperSpec) -> MapRowToPost:
+    """Reference mapper that walks the spec's paths for every row."""
+
+    def lookup(row, paths, default):
+        for path in paths:
+            value = row
+            try:
+                for key in path.split("."):
+                    value = value[int(key)] if key.isdigit() else value[key]
+            except (LookupError, TypeError):
+                continue
+            if value:
+                return value
+        return default
+
+    def mapper(index: int, row: dict) -> PostData:
+        content = lookup(row, spec.get("content_paths", []), "")
+        if spec.get("repair_text"):
+            content = repair_mojibake(content)
+        timestamp = lookup(row, spec.get("timestamp_paths", []), 0)
+        return PostData(
+            index=index,
+            content=content,
+            datetime=pretty_date_from_epoch_time(int(timestamp)),
+        )
+
+    return mapper
+
+
+def timed(label: str, mapper: MapRowToPost, rows: list, repeat: int = 3) -> None:
+    """Print the best of `repeat` runs of mapping `rows`."""
+
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        [mapper(index, row) for index, row in enumerate(rows)]
+        elapsed.append(time.perf_counter() - start)
+
+    print(f"{label:<16}{min(elapsed):>8.3f}s")
+
+
+def _no_date(timestamp: int) -> str:
+    return ""
+
+
+@contextmanager
+def dates_stubbed(mappers: List[MapRowToPost]) -> Iterator[None]:
+    """Stub out date formatting in the modules the mappers are defined in."""
+
+    # mappers are plain functions, which `MapRowToPost` does not promise
+    namespaces = [getattr(mapper, "__globals__") for mapper in mappers]
+    for namespace in namespaces:
+        namespace["pretty_date_from_epoch_time"] = _no_date
+    try:
+        yield
+    finally:
+        for namespace in namespaces:
+            namespace["pretty_date_from_epoch_time"] = pretty_date_from_epoch_time
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rows = [
+        {"timestamp": 1500000000 + index, "data": [{"post": f"post {index}"}]}
+        for index in range(count)
+    ]
+
+    mappers = {
+        "hand-written": facebook_mapper,
+        "compiled spec": compile_mapper_spec(FB_SPEC),
+        "interpreted spec": interpret_mapper_spec(FB_SPEC),
+    }
+
+    print(f"{count} rows, end to end")
+    for label, mapper in mappers.items():
+        timed(label, mapper, rows)
+
+    print(f"{count} rows, lookups only (date formatting stubbed out)")
+    with dates_stubbed(list(mappers.values())):
+        for label, mapper in mappers.items():
+            timed(label, mapper, rows)
+
+
+if __name__ == "__main__":
+    main()
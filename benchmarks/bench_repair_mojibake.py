@@ -0,0 +1,67 @@
+"""
+Benchmark the mojibake repair stage against the plain FB mapping step.
+
+Run with `poetry run python benchmarks/bench_repair_mojibake.py [rows]`.
+"""
+
+import sys
+import time
+
+from post_roulette.lib import repair_mojibake
+from post_roulette.mappers.facebook_mapper import facebook_mapper
+
+ASCII_SAMPLE = "just a regular ascii post about nothing in particular"
+MOJIBAKED_SAMPLES = [
+    "café au lait, déjà vu, naïve façade".encode("utf-8").decode("latin-1"),
+    "سلام دنیا، این یک پست فارسی است".encode("utf-8").decode("latin-1"),
+    "emoji 🎉🔥 party".encode("utf-8").decode("latin-1"),
+]
+
+# rows out of every 10 that are mojibaked, the rest are ASCII
+MOJIBAKED_PER_10 = 2
+
+
+def make_rows(count: int) -> list:
+    """Build FB shaped rows, mostly ASCII with a share of mojibaked posts."""
+
+    def sample(index: int) -> str:
+        if index % 10 < MOJIBAKED_PER_10:
+            return MOJIBAKED_SAMPLES[index % len(MOJIBAKED_SAMPLES)]
+        return ASCII_SAMPLE
+
+    # suffix with the index, as posts in a real dump are almost always unique
+    return [
+        {
+            "timestamp": 1500000000 + index,
+            "data": [{"post": f"{sample(index)} {index}"}],
+        }
+        for index in range(count)
+    ]
+
+
+def timed(label: str, fn) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}{elapsed:>8.3f}s")
+    return elapsed
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rows = make_rows(count)
+    contents = [row["data"][0]["post"] for row in rows]
+
+    print(f"{count} rows, {MOJIBAKED_PER_10 * 10}% mojibaked")
+    mapping = timed(
+        "facebook_mapper (w/ repair)",
+        lambda: [facebook_mapper(index, row) for index, row in enumerate(rows)],
+    )
+    repair = timed(
+        "repair_mojibake only", lambda: [repair_mojibake(c) for c in contents]
+    )
+    print(f"repair overhead: {repair / mapping:.1%} of mapping time")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Benchmark the cold start of the `roulette` entry point: import time of the
+package, wall-clock time of `--help`, and wall-clock time until the app renders
+its first frame. The measurements and their budgets live in `tests/startup.py`,
+and the budgets are enforced by `tests/test_startup.py`.
+
+Run from the repo root with `poetry run python -m benchmarks.bench_startup`.
+"""
+
+from tests.startup import (
+    FIRST_FRAME_BUDGET_S,
+    HELP_BUDGET_S,
+    IMPORT_BUDGET_US,
+    LAZY_MODULES,
+    first_frame_time,
+    help_time,
+    import_time,
+)
+
+
+def main() -> None:
+    cumulative, modules = import_time()
+    print(
+        f"import post_roulette  {cumulative / 1000:>8.1f}ms"
+        + f"  (budget {IMPORT_BUDGET_US / 1000:.0f}ms)"
+    )
+    print(f"eager lazy modules    {sorted(LAZY_MODULES & modules) or 'none'}")
+    print(f"--help                {help_time():>8.3f}s  (budget {HELP_BUDGET_S}s)")
+    print(
+        f"first frame           {first_frame_time():>8.3f}s"
+        + f"  (budget {FIRST_FRAME_BUDGET_S}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,22 @@
 __version__ = "0.1.0"
 
 import argparse
+import re
+import sys
+from datetime import date
 
-from tinydb import TinyDB
+from .config import CacheConfig, export_formats, source_configs
 
-from .app import App
-from .config import source_configs
-from .lib import load_and_map_data
-from .models import Cursors, Posts
+
+def _regex(pattern: str) -> str:
+    """Validate a regex argument, so a bad pattern fails before loading any data."""
+
+    try:
+        re.compile(pattern)
+    except re.error as error:
+        raise argparse.ArgumentTypeError(f"invalid regex {pattern!r}: {error}")
+
+    return pattern
 
 
 def main() -> None:
@@ -32,17 +41,134 @@ def main() -> None:
         help="display the indexed post and quit, in case app fails to load post",
     )
 
+    parser.add_argument(
+        "--source",
+        action="append",
+        default=[],
+        choices=source_configs.keys(),
+        help="another configuration to switch to from within the app, repeatable",
+    )
+
+    parser.add_argument(
+        "--cache-mb",
+        type=int,
+        default=CacheConfig.DATASET_BUDGET_MB,
+        help="memory budget in MB for the posts of the sources switched between",
+    )
+
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="show only one post out of each group of reposts and near-duplicates",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="number of processes used to find near-duplicates with --dedup",
+    )
+
+    commands = parser.add_subparsers(
+        dest="command",
+        title="commands",
+        description="run without a command to start the app",
+    )
+
+    save_parser = commands.add_parser(
+        "save",
+        help="save all posts matching the given filters without starting the app",
+    )
+    save_parser.add_argument(
+        "--regex",
+        type=_regex,
+        help="only save posts whose content matches this pattern",
+    )
+    save_parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        help="only save posts from this date (YYYY-MM-DD) onward",
+    )
+    save_parser.add_argument(
+        "--until",
+        type=date.fromisoformat,
+        help="only save posts up to and including this date (YYYY-MM-DD)",
+    )
+    save_parser.add_argument(
+        "--start", type=int, help="only save posts from this index onward"
+    )
+    save_parser.add_argument(
+        "--end", type=int, help="only save posts before this index"
+    )
+
+    export_parser = commands.add_parser(
+        "export", help="write out saved posts without starting the app"
+    )
+    export_parser.add_argument(
+        "--format", choices=export_formats, default="jsonl", help="output format"
+    )
+    export_parser.add_argument(
+        "--output", help="path of the file to write to, defaults to stdout"
+    )
+
     args = parser.parse_args()
     source_config = source_configs[args.config_name]
     in_debugging_mode = args.debug
 
-    db = TinyDB("./db/db.json")
+    # Modules beyond the config are imported on the code paths that use them, so
+    # that `--help` and the commands below start fast. Notably `tinydb` comes in
+    # with the models, `curses` only when the app renders, and mappers only when
+    # a source that uses them is loaded.
+    from .models import Cursors, Posts, SharedTinyDB
+
+    db = SharedTinyDB("./db/db.json")
     cursors = Cursors(db)
     posts = Posts(db)
-    mapped_posts = load_and_map_data(
-        source_config["data_file_name"], source_config["mapper_function_name"]
+
+    # export only needs the database, so skip loading the data dump
+    if args.command == "export":
+        from .lib import export_posts
+
+        documents = sorted(
+            posts.get_all(source_config["name"]), key=lambda doc: doc["index"]
+        )
+        if args.output is None:
+            export_posts(documents, sys.stdout, args.format)
+            return
+
+        # `csv` does its own newline handling, so the file must not translate them
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            export_posts(documents, f, args.format)
+        return
+
+    if args.command == "save":
+        from .lib import filter_posts, load_and_map_data
+
+        mapped_posts = load_and_map_data(source_config)
+        matches = filter_posts(
+            mapped_posts, args.regex, args.since, args.until, args.start, args.end
+        )
+        created = posts.create_many(source_config["name"], matches)
+        print(f"Saved {created} new {source_config['name']} posts.")
+        return
+
+    from .app import App
+    from .lib import DatasetCache
+
+    # sources to switch between in the app, in the order given, without repeats
+    config_names = list(dict.fromkeys([args.config_name, *args.source]))
+    datasets = DatasetCache(
+        source_configs, args.cache_mb * 2**20, CacheConfig.CACHE_DIR
     )
 
-    app = App(source_config["name"], cursors, posts, mapped_posts, in_debugging_mode)
+    app = App(
+        config_names,
+        cursors,
+        posts,
+        datasets,
+        in_debugging_mode,
+        args.dedup,
+        args.workers,
+    )
 
     app.render()
@@ -1,11 +1,14 @@
 import json
-from curses import window, wrapper
-from typing import List
+from typing import TYPE_CHECKING, Dict, List, Optional
 
+from ..config import CacheConfig, source_configs
+from ..lib import DatasetCache, cluster_near_duplicates
 from ..models import Cursors, Posts
-from ..types import PostData
 from .state_models import ViewState
 
+if TYPE_CHECKING:
+    from curses import window
+
 
 class App:
     """
@@ -14,18 +17,88 @@ class App:
 
     def __init__(
         self,
-        source_name: str,
+        config_names: List[str],
         cursors: Cursors,
         posts: Posts,
-        mapped_posts: List[PostData],
+        datasets: DatasetCache,
         in_debugging_mode: bool = False,
+        dedup: bool = False,
+        workers: int = 1,
     ) -> None:
-        self.source_name = source_name
+        self.config_names = config_names
+        self.cursors = cursors
+        self.posts = posts
+        self.datasets = datasets
         self.in_debugging_mode = in_debugging_mode
-        self.window: window
-        self.view = ViewState(source_name, cursors, posts, mapped_posts)
+        self.dedup = dedup
+        self.workers = workers
+        self.window: "window"
+        self.views: Dict[str, ViewState] = {}
+        self.config_name = config_names[0]
+        self.view = self._attach_view(self.config_name)
+        self._prefetch_next_source()
+
+    # ACCESSORS
+
+    @property
+    def source_name(self) -> str:
+        """Name of the source currently in view."""
+        return self.view.source_name
+
+    @property
+    def next_config_name(self) -> str:
+        """Config name of the source after the current one."""
+        position = self.config_names.index(self.config_name)
+        return self.config_names[(position + 1) % len(self.config_names)]
+
+    # ACTIONS
+
+    def _attach_view(self, config_name: str) -> ViewState:
+        """
+        Get the view for a source, creating it on first use, with the source's
+        mapped posts attached.
+        """
+
+        mapped_posts = self.datasets.get(config_name)
+
+        if config_name in self.views:
+            view = self.views[config_name]
+            view.mapped_posts = mapped_posts
+            return view
+
+        source_name = source_configs[config_name]["name"]
+        clusters = (
+            cluster_near_duplicates(
+                source_name,
+                [post["content"] for post in mapped_posts],
+                workers=self.workers,
+                cache_dir=CacheConfig.CACHE_DIR,
+            )
+            if self.dedup
+            else None
+        )
+        view = ViewState(source_name, self.cursors, self.posts, mapped_posts, clusters)
+        self.views[config_name] = view
 
-    def _render(self, window: window) -> None:
+        return view
+
+    def _prefetch_next_source(self) -> None:
+        """Load the source most likely to be switched to next in the background."""
+        if len(self.config_names) > 1:
+            self.datasets.prefetch(self.next_config_name)
+
+    def switch_source(self) -> None:
+        """Switch to the next source, keeping the position in each source."""
+
+        # detach the posts of the view being left, so that the dataset cache is
+        # their only owner and can evict them
+        self.view.mapped_posts = []
+
+        self.config_name = self.next_config_name
+        self.view = self._attach_view(self.config_name)
+        self._prefetch_next_source()
+
+    def _render(self, window: "window") -> None:
         """Render the app."""
 
         # avoids circular imports
@@ -35,11 +108,18 @@ class App:
         sanitize_cursor_view = SanitizeCursorView(self)
         main_view = MainView(self)
 
-        quit_after = sanitize_cursor_view.render()
-        if quit_after:
-            return
+        # view whose cursor was last checked
+        checked_view: Optional[ViewState] = None
 
         while True:
+            # check the cursor whenever a view is attached, which is at start and
+            # after switching sources, as only then can it be out of range
+            if self.view is not checked_view:
+                checked_view = self.view
+                quit_after = sanitize_cursor_view.render()
+                if quit_after:
+                    break
+
             quit_after = main_view.render()
             if quit_after:
                 break
@@ -53,4 +133,7 @@ class App:
             print(json.dumps(self.view.current_post_row, indent=4))
             return
 
+        # only import curses when rendering, as debugging mode does not need it
+        from curses import wrapper
+
         return wrapper(self._render)
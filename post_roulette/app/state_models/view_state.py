@@ -1,4 +1,5 @@
-from random import randrange
+from bisect import bisect_left, bisect_right
+from random import choice, randrange
 from typing import List, Optional
 
 from tinydb.table import Document
@@ -20,13 +21,32 @@ class ViewState:
         cursors: Cursors,
         posts: Posts,
         mapped_posts: List[PostData],
+        clusters: Optional[List[int]] = None,
     ) -> None:
         self.source_name = source_name
         self.cursors = cursors
         self.posts = posts
         self.mapped_posts = mapped_posts
+
+        # when near-duplicate clusters are given, only the representative of
+        # each cluster is shown
+        self.representatives: Optional[List[int]] = (
+            None
+            if clusters is None
+            else [index for index, cluster in enumerate(clusters) if cluster == index]
+        )
+
         self.post = PostState()
-        self.load_post()
+
+        # a cursor saved for a dump that has shrunk since is left for the sanitize
+        # cursor view to reset, which loads the post then
+        if self.is_cursor_in_range:
+            # a cursor saved without near-duplicate clusters may point at a post
+            # that is not shown, so start from its cluster's representative
+            if clusters is not None and clusters[self.cursor] != self.cursor:
+                self.cursor = clusters[self.cursor]
+
+            self.load_post()
 
     # ACCESSORS
 
@@ -39,6 +59,11 @@ class ViewState:
     def cursor(self, value: int) -> None:
         self.cursors.set_value(self.source_name, value)
 
+    @property
+    def is_cursor_in_range(self) -> bool:
+        """Whether the cursor points at a post in post data."""
+        return self.cursor in range(0, len(self.mapped_posts))
+
     @property
     def current_post_row(self) -> PostData:
         """Current row in data set selected by index."""
@@ -49,15 +74,41 @@ class ViewState:
         """Current post in DB selected by index, if it exists."""
         return self.posts.get(self.source_name, self.cursor)
 
+    @property
+    def next_index(self) -> Optional[int]:
+        """Index of the next post to show after this in post data, if any."""
+        cursor = self.cursor
+
+        if self.representatives is None:
+            return cursor + 1 if len(self.mapped_posts) - 1 > cursor else None
+
+        position = bisect_right(self.representatives, cursor)
+        return (
+            self.representatives[position]
+            if position < len(self.representatives)
+            else None
+        )
+
+    @property
+    def previous_index(self) -> Optional[int]:
+        """Index of the previous post to show before this in post data, if any."""
+        cursor = self.cursor
+
+        if self.representatives is None:
+            return cursor - 1 if cursor > 0 else None
+
+        position = bisect_left(self.representatives, cursor)
+        return self.representatives[position - 1] if position > 0 else None
+
     @property
     def has_next_post(self) -> bool:
         """Whether there is another post after this in post data."""
-        return len(self.mapped_posts) - 1 > self.cursor
+        return self.next_index is not None
 
     @property
     def has_previous_post(self) -> bool:
         """Whether there is another post prior to this in post data."""
-        return self.cursor > 0
+        return self.previous_index is not None
 
     @property
     def is_post_saved(self) -> bool:
@@ -69,10 +120,14 @@ class ViewState:
     def reset_cursor(self) -> None:
         """Reset cursor to start."""
         self.cursor = 0
+        self.load_post()
 
     def random_post(self) -> None:
         """Load a random post."""
-        self.cursor = randrange(0, len(self.mapped_posts) - 1)
+        if self.representatives:
+            self.cursor = choice(self.representatives)
+        else:
+            self.cursor = randrange(0, len(self.mapped_posts) - 1)
         self.load_post()
 
     def load_post(self) -> None:
@@ -81,14 +136,16 @@ class ViewState:
 
     def next_post(self) -> None:
         """Load next post if it exists."""
-        if self.has_next_post:
-            self.cursor += 1
+        next_index = self.next_index
+        if next_index is not None:
+            self.cursor = next_index
             self.load_post()
 
     def previous_post(self) -> None:
         """Load previous post if it exists."""
-        if self.has_previous_post:
-            self.cursor -= 1
+        previous_index = self.previous_index
+        if previous_index is not None:
+            self.cursor = previous_index
             self.load_post()
 
     def toggle_post(self) -> None:
@@ -20,7 +20,7 @@ class MainView:
         Input handler for main view.
 
         Allow user to jog through post, post pages, save and drop posts from database
-        randomize their post selection, or quit.
+        randomize their post selection, switch sources, or quit.
         """
 
         # Value returned by function. If exit action is taken, value
@@ -72,6 +72,13 @@ class MainView:
                 self.app.view.random_post()
                 break
 
+            # handle switch source action
+            if len(self.app.config_names) > 1 and is_key(
+                key, ViewConfig.SWITCH_SOURCE_KEY
+            ):
+                self.app.switch_source()
+                break
+
         return quit_after
 
     # CURSES RENDERERS
@@ -80,6 +87,9 @@ class MainView:
         """Render app header for main view."""
 
         text = f"POST ROULETTE: {self.app.source_name.upper()}"
+        if len(self.app.config_names) > 1:
+            position = self.app.config_names.index(self.app.config_name) + 1
+            text += f" ({position} / {len(self.app.config_names)})"
         self.app.window.addstr(
             ViewConfig.PADDING_TOP,
             ViewConfig.PADDING_LEFT,
@@ -169,10 +179,12 @@ class MainView:
             + f"({ViewConfig.TOGGLE_POST_KEY})"
         )
         random_text = f"Rand ({ViewConfig.RANDOM_POST_KEY})"
+        source_text = f"Source ({ViewConfig.SWITCH_SOURCE_KEY})"
         quit_text = f"Quit ({ViewConfig.QUIT_KEY})"
-        text = (
-            f" {prev_text} | {toggle_text} | {next_text} | {random_text} | {quit_text} "
-        )
+        controls = [prev_text, toggle_text, next_text, random_text]
+        if len(self.app.config_names) > 1:
+            controls.append(source_text)
+        text = f" {' | '.join([*controls, quit_text])} "
 
         control_content = self.app.window.subwin(
             1,
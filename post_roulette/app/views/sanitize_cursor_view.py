@@ -55,8 +55,10 @@ class SanitizeCursorView:
         quit_after = False
 
         # determine if cursor is within range for data
-        if self.app.view.cursor not in range(0, len(self.app.view.mapped_posts) - 1):
+        if not self.app.view.is_cursor_in_range:
 
+            # clear whatever the previous view drew, such as another source's post
+            self.app.window.clear()
             warning_content_box = self.app.window.subwin(
                 20, ViewConfig.WIDTH, ViewConfig.PADDING_TOP, ViewConfig.PADDING_LEFT
             )
@@ -1,15 +1,36 @@
-from typing import Dict
+from typing import Dict, List
 
-from .types import SourceConfig
+from .types import MapperSpec, SourceConfig
 
 source_configs: Dict[str, SourceConfig] = {
     "Facebook": SourceConfig(
         name="facebook",
         mapper_function_name="facebook_mapper",
         data_file_name="fb_posts.json",
-    )
+    ),
+    "Twitter": SourceConfig(
+        name="twitter",
+        data_file_name="tweets.json",
+        mapper_spec=MapperSpec(
+            content_paths=["tweet.full_text", "full_text"],
+            timestamp_paths=["tweet.created_at", "created_at"],
+            timestamp_format="%a %b %d %H:%M:%S %z %Y",
+        ),
+    ),
+    "Instagram": SourceConfig(
+        name="instagram",
+        data_file_name="ig_posts.json",
+        mapper_spec=MapperSpec(
+            content_paths=["title", "media.0.title"],
+            timestamp_paths=["creation_timestamp", "media.0.creation_timestamp"],
+            timestamp_unit="s",
+            repair_text=True,
+        ),
+    ),
 }
 
+export_formats: List[str] = ["jsonl", "csv", "md"]
+
 
 class ViewConfig:
     PADDING_LEFT: int = 2
@@ -26,3 +47,11 @@ class ViewConfig:
     PREV_PAGE_KEY: str = "K"
     QUIT_KEY: str = "Q"
     RESET_CURSOR_KEY: str = "C"
+    SWITCH_SOURCE_KEY: str = "S"
+
+
+class CacheConfig:
+    # memory budget for the mapped posts of all sources loaded in a session
+    DATASET_BUDGET_MB: int = 1024
+    # where dataset snapshots and near-duplicate signatures are cached
+    CACHE_DIR: str = "./db/cache"
@@ -1,4 +1,19 @@
+from .cluster_near_duplicates import cluster_near_duplicates
+from .compile_mapper_spec import compile_mapper_spec
+from .dataset_cache import DatasetCache
+from .export_posts import export_posts
+from .filter_posts import filter_posts
 from .load_and_map_data import load_and_map_data
 from .pretty_date_from_epoch_time import pretty_date_from_epoch_time
+from .repair_mojibake import repair_mojibake
 
-__all__ = ["load_and_map_data", "pretty_date_from_epoch_time"]
+__all__ = [
+    "cluster_near_duplicates",
+    "compile_mapper_spec",
+    "DatasetCache",
+    "export_posts",
+    "filter_posts",
+    "load_and_map_data",
+    "pretty_date_from_epoch_time",
+    "repair_mojibake",
+]
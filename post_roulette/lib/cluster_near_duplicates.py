@@ -0,0 +1,190 @@
+import os
+import random
+import zlib
+from array import array
+from glob import glob
+from typing import Iterable, List, Optional
+
+# MinHash signature length, split into LSH bands of `ROWS_PER_BAND` values. Posts
+# whose signatures share a band become candidates, which puts the LSH threshold
+# at roughly (1 / BANDS) ** (1 / ROWS_PER_BAND) ~= 0.6 Jaccard similarity.
+NUM_PERMUTATIONS = 32
+ROWS_PER_BAND = 4
+BANDS = NUM_PERMUTATIONS // ROWS_PER_BAND
+
+# minimum estimated Jaccard similarity for candidates to be clustered together
+SIMILARITY_THRESHOLD = 0.5
+
+# number of words per shingle
+SHINGLE_SIZE = 3
+
+# signature value for posts without any text, which are never clustered
+EMPTY = 0xFFFFFFFF
+
+# XOR-ing a 32 bit hash with a mask permutes the hash space, so each mask acts
+# as one of the MinHash permutations. The seed is fixed so that signatures are
+# stable across processes and runs, and can be cached on disk.
+_MASKS = [random.Random(seed).getrandbits(32) for seed in range(NUM_PERMUTATIONS)]
+
+
+def _signature(content: str) -> List[int]:
+    """MinHash signature of the word shingles in `content`."""
+
+    words = content.lower().split()
+
+    if not words:
+        return [EMPTY] * NUM_PERMUTATIONS
+
+    shingles = {
+        " ".join(words[start : start + SHINGLE_SIZE])
+        for start in range(max(1, len(words) - SHINGLE_SIZE + 1))
+    }
+    hashes = [zlib.crc32(shingle.encode()) for shingle in shingles]
+
+    return [min(map(mask.__xor__, hashes)) for mask in _MASKS]
+
+
+def _signatures(contents: List[str]) -> array:
+    """Flat array of the MinHash signatures for a chunk of contents."""
+
+    signatures = array("I")
+    for content in contents:
+        signatures.extend(_signature(content))
+
+    return signatures
+
+
+def _chunks(contents: List[str], size: int) -> Iterable[List[str]]:
+    for start in range(0, len(contents), size):
+        yield contents[start : start + size]
+
+
+def _fingerprint(contents: List[str]) -> int:
+    """Cheap checksum of all contents, used to key the signature cache."""
+
+    checksum = 0
+    for content in contents:
+        checksum = zlib.crc32(content.encode(), checksum)
+
+    return checksum
+
+
+def _load_or_compute_signatures(
+    source_name: str, contents: List[str], workers: int, cache_dir: Optional[str]
+) -> array:
+    """
+    Get the MinHash signatures for all contents, reading them from the on disk
+    cache for this dump if it exists and writing them to it otherwise.
+    """
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = os.path.join(
+            cache_dir,
+            f"{source_name}-{len(contents)}-{_fingerprint(contents):08x}"
+            + f"-{NUM_PERMUTATIONS}.minhash",
+        )
+
+        if os.path.exists(cache_path):
+            signatures = array("I")
+            try:
+                with open(cache_path, "rb") as f:
+                    signatures.fromfile(f, len(contents) * NUM_PERMUTATIONS)
+                return signatures
+            except (ValueError, EOFError):
+                # a short or corrupt cache file, so compute the signatures again
+                pass
+
+    if workers > 1:
+        # only import multiprocessing when it is used, as it is slow to import
+        from multiprocessing import Pool
+
+        signatures = array("I")
+        with Pool(workers) as pool:
+            for chunk in pool.imap(_signatures, _chunks(contents, 10_000)):
+                signatures.extend(chunk)
+    else:
+        signatures = _signatures(contents)
+
+    if cache_path is not None:
+        # drop signatures cached for previous versions of this dump
+        for stale_path in glob(
+            os.path.join(cache_dir or "", f"{source_name}-*.minhash")
+        ):
+            os.remove(stale_path)
+
+        os.makedirs(cache_dir or "", exist_ok=True)
+        # write to a temporary file first, so that an interrupted write never
+        # leaves a partial cache file behind
+        with open(f"{cache_path}.tmp", "wb") as f:
+            signatures.tofile(f)
+        os.replace(f"{cache_path}.tmp", cache_path)
+
+    return signatures
+
+
+def cluster_near_duplicates(
+    source_name: str,
+    contents: List[str],
+    workers: int = 1,
+    cache_dir: Optional[str] = "./db/cache",
+) -> List[int]:
+    """
+    Cluster reposted and lightly edited posts together, and return the index of
+    each post's cluster representative (the first post in its cluster).
+
+    Posts are compared by the MinHash signatures of their word shingles, and only
+    posts that share an LSH band are compared at all, so clustering runs in
+    near-linear time. Signatures can be computed across `workers` processes and
+    are cached per dump in `cache_dir`.
+    """
+
+    count = len(contents)
+    signatures = _load_or_compute_signatures(source_name, contents, workers, cache_dir)
+    raw = signatures.tobytes()
+    width = NUM_PERMUTATIONS * signatures.itemsize
+    band_width = ROWS_PER_BAND * signatures.itemsize
+    min_matches = SIMILARITY_THRESHOLD * NUM_PERMUTATIONS
+
+    # union-find forest, where the root of every cluster is its lowest index
+    parents = list(range(count))
+
+    def find(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    # bucket one band at a time so that only a single band's buckets are held in
+    # memory at once
+    for band in range(BANDS):
+        buckets: dict = {}
+
+        for index in range(count):
+            offset = index * NUM_PERMUTATIONS
+            if signatures[offset] == EMPTY:
+                continue
+
+            start = index * width + band * band_width
+            first = buckets.setdefault(hash(raw[start : start + band_width]), index)
+            if first == index:
+                continue
+
+            root, other_root = find(index), find(first)
+            if root == other_root:
+                continue
+
+            # verify candidates against their estimated similarity to weed out
+            # posts that only share a single band by chance
+            other_offset = first * NUM_PERMUTATIONS
+            matches = sum(
+                a == b
+                for a, b in zip(
+                    signatures[offset : offset + NUM_PERMUTATIONS],
+                    signatures[other_offset : other_offset + NUM_PERMUTATIONS],
+                )
+            )
+            if matches >= min_matches:
+                parents[max(root, other_root)] = min(root, other_root)
+
+    return [find(index) for index in range(count)]
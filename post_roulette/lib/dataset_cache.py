@@ -0,0 +1,206 @@
+import marshal
+import os
+import sys
+import zlib
+from collections import OrderedDict
+from glob import glob
+from threading import Lock, Thread
+from typing import Dict, List
+
+from ..types import PostData, SourceConfig
+from .load_and_map_data import load_and_map_data
+
+# version of the snapshot format and of the mapping code; bump it when either
+# changes, so that snapshots written by earlier versions are not used
+SNAPSHOT_VERSION = 1
+
+
+def _size_of(mapped_posts: List[PostData]) -> int:
+    """Approximate memory used by mapped posts, in bytes."""
+
+    if not mapped_posts:
+        return sys.getsizeof(mapped_posts)
+
+    # every row is a dict with the same keys and a small int index, so only the
+    # strings vary in size
+    row_size = sys.getsizeof(mapped_posts[0]) + sys.getsizeof(len(mapped_posts))
+    strings_size = sum(
+        sys.getsizeof(post["content"]) + sys.getsizeof(post["datetime"])
+        for post in mapped_posts
+    )
+
+    return sys.getsizeof(mapped_posts) + row_size * len(mapped_posts) + strings_size
+
+
+class DatasetCache:
+    """
+    Keep the mapped posts of recently used sources in memory within a budget of
+    `budget_bytes`, and evict the least recently used ones to compact snapshots
+    in `snapshot_dir`, which load much faster than mapping the data dump again.
+    """
+
+    def __init__(
+        self,
+        source_configs: Dict[str, SourceConfig],
+        budget_bytes: int,
+        snapshot_dir: str = "./db/cache",
+    ) -> None:
+        self.source_configs = source_configs
+        self.budget_bytes = budget_bytes
+        self.snapshot_dir = snapshot_dir
+
+        self._lock = Lock()
+        self._datasets: "OrderedDict[str, List[PostData]]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._loading: Dict[str, Thread] = {}
+
+    # ACCESSORS
+
+    def __contains__(self, config_name: str) -> bool:
+        """Whether the posts for a source are in memory."""
+        return config_name in self._datasets
+
+    def _snapshot_path(self, config_name: str) -> str:
+        """
+        Path of the snapshot for a source, which is specific to the version of
+        its data dump, the mapper configured for it and the snapshot format.
+        """
+
+        source_config = self.source_configs[config_name]
+        stat = os.stat(f"./data/{source_config['data_file_name']}")
+        mapper = repr(
+            source_config.get("mapper_spec")
+            or source_config.get("mapper_function_name")
+        )
+
+        return os.path.join(
+            self.snapshot_dir,
+            f"{source_config['name']}-{stat.st_size}-{stat.st_mtime_ns}"
+            + f"-{zlib.crc32(mapper.encode()):08x}-v{SNAPSHOT_VERSION}.posts",
+        )
+
+    # ACTIONS
+
+    def get(self, config_name: str) -> List[PostData]:
+        """Get the mapped posts for a source, loading them if needed."""
+
+        with self._lock:
+            if config_name in self._datasets:
+                self._datasets.move_to_end(config_name)
+                return self._datasets[config_name]
+
+            loading = self._loading.get(config_name)
+
+        # wait for a prefetch of this source instead of loading it twice
+        if loading is not None:
+            loading.join()
+            with self._lock:
+                if config_name in self._datasets:
+                    self._datasets.move_to_end(config_name)
+                    return self._datasets[config_name]
+
+        mapped_posts = self._load(config_name)
+        self._store(config_name, mapped_posts, evict=True)
+
+        return mapped_posts
+
+    def prefetch(self, config_name: str) -> None:
+        """Load the mapped posts for a source in the background."""
+
+        with self._lock:
+            if config_name in self._datasets or config_name in self._loading:
+                return
+
+            thread = Thread(target=self._prefetch, args=(config_name,), daemon=True)
+            self._loading[config_name] = thread
+
+        thread.start()
+
+    def _prefetch(self, config_name: str) -> None:
+        try:
+            mapped_posts = self._load(config_name)
+            self._store(config_name, mapped_posts, evict=False)
+        finally:
+            with self._lock:
+                del self._loading[config_name]
+
+    def _load(self, config_name: str) -> List[PostData]:
+        """Load mapped posts from the snapshot of a source, or its data dump."""
+
+        snapshot_path = self._snapshot_path(config_name)
+
+        if not os.path.exists(snapshot_path):
+            return load_and_map_data(self.source_configs[config_name])
+
+        try:
+            with open(snapshot_path, "rb") as f:
+                contents, datetimes = marshal.load(f)
+        except (EOFError, ValueError, TypeError):
+            # a corrupt snapshot, so drop it and map the data dump again
+            os.remove(snapshot_path)
+            return load_and_map_data(self.source_configs[config_name])
+
+        return [
+            {"index": index, "content": content, "datetime": datetime}
+            for index, content, datetime in zip(
+                range(len(contents)), contents, datetimes
+            )
+        ]
+
+    def _store(
+        self, config_name: str, mapped_posts: List[PostData], evict: bool
+    ) -> None:
+        """
+        Keep mapped posts in memory, evicting the least recently used datasets
+        to stay within budget.
+
+        Without `evict`, datasets that do not fit in the budget as is are written
+        to a snapshot instead, so a prefetch never pushes out datasets in use.
+        """
+
+        size = _size_of(mapped_posts)
+        evicted = []
+
+        with self._lock:
+            used = sum(self._sizes.values())
+
+            if evict or used + size <= self.budget_bytes:
+                self._datasets[config_name] = mapped_posts
+                self._sizes[config_name] = size
+                used += size
+
+                # always keep the dataset just stored, even if over budget
+                while used > self.budget_bytes and len(self._datasets) > 1:
+                    evicted_name, evicted_posts = self._datasets.popitem(last=False)
+                    used -= self._sizes.pop(evicted_name)
+                    evicted.append((evicted_name, evicted_posts))
+            else:
+                evicted.append((config_name, mapped_posts))
+
+        for evicted_name, evicted_posts in evicted:
+            self._write_snapshot(evicted_name, evicted_posts)
+
+    def _write_snapshot(self, config_name: str, mapped_posts: List[PostData]) -> None:
+        """Write mapped posts to a snapshot as a pair of columns."""
+
+        snapshot_path = self._snapshot_path(config_name)
+        if os.path.exists(snapshot_path):
+            return
+
+        # drop snapshots of previous versions of the data dump
+        source_name = self.source_configs[config_name]["name"]
+        for stale_path in glob(
+            os.path.join(self.snapshot_dir, f"{source_name}-*.posts")
+        ):
+            os.remove(stale_path)
+
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        with open(f"{snapshot_path}.tmp", "wb") as f:
+            marshal.dump(
+                (
+                    [post["content"] for post in mapped_posts],
+                    [post["datetime"] for post in mapped_posts],
+                ),
+                f,
+            )
+        os.replace(f"{snapshot_path}.tmp", snapshot_path)
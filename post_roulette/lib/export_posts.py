@@ -0,0 +1,36 @@
+import csv
+import json
+from typing import Iterable, Mapping, TextIO
+
+from ..config import export_formats
+
+FIELDS = ["source_name", "index", "datetime", "content"]
+
+
+def export_posts(documents: Iterable[Mapping], file: TextIO, format: str) -> int:
+    """
+    Stream saved post documents to `file` as JSON lines ("jsonl"), CSV ("csv") or
+    Markdown ("md") and return the number of posts written.
+    """
+
+    if format not in export_formats:
+        raise ValueError(f"Unsupported export format: {format!r}")
+
+    if format == "csv":
+        writer = csv.DictWriter(file, FIELDS, extrasaction="ignore")
+        writer.writeheader()
+
+    count = 0
+    for document in documents:
+        if format == "jsonl":
+            file.write(json.dumps(dict(document), ensure_ascii=False) + "\n")
+        elif format == "csv":
+            writer.writerow(document)
+        else:
+            file.write(
+                f"## {document['source_name']} #{document['index']} – "
+                + f"{document['datetime']}\n\n{document['content']}\n\n"
+            )
+        count += 1
+
+    return count
@@ -0,0 +1,38 @@
+import re
+from datetime import date, datetime
+from typing import Iterator, List, Optional
+
+from ..types import PostData
+
+# format of `PostData["datetime"]`, see `pretty_date_from_epoch_time`
+DATETIME_FORMAT = "%m/%d/%Y, %H:%M:%S"
+
+
+def filter_posts(
+    mapped_posts: List[PostData],
+    pattern: Optional[str] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+) -> Iterator[PostData]:
+    """
+    Yield the posts whose index is in `start` to `end` (exclusive), whose date is
+    in `since` to `until` (inclusive) and whose content matches the regex
+    `pattern`. Filters that are not given match every post.
+    """
+
+    regex = None if pattern is None else re.compile(pattern)
+
+    for post in mapped_posts[start:end]:
+        if regex is not None and not regex.search(post["content"]):
+            continue
+
+        if since is not None or until is not None:
+            posted_on = datetime.strptime(post["datetime"], DATETIME_FORMAT).date()
+            if since is not None and posted_on < since:
+                continue
+            if until is not None and posted_on > until:
+                continue
+
+        yield post
@@ -1,21 +1,39 @@
-import importlib
 import json
 from typing import List
 
-from ..types import PostData
+from ..mappers import get_mapper
+from ..types import MapRowToPost, PostData, SourceConfig
+from .compile_mapper_spec import compile_mapper_spec
 
 
-def load_and_map_data(file_name: str, mapper_function_name: str) -> List[PostData]:
+def _resolve_mapper(source_config: SourceConfig) -> MapRowToPost:
+    """
+    Get the mapper for a source, compiling its `mapper_spec` if it has one and
+    otherwise looking up its `mapper_function_name` in the mappers registry.
+    """
+
+    if "mapper_spec" in source_config:
+        return compile_mapper_spec(source_config["mapper_spec"])
+
+    if "mapper_function_name" in source_config:
+        return get_mapper(source_config["mapper_function_name"])
+
+    raise ValueError(
+        f"Source config {source_config['name']!r} has neither a "
+        + "`mapper_spec` nor a `mapper_function_name`"
+    )
+
+
+def load_and_map_data(source_config: SourceConfig) -> List[PostData]:
     """
     Load post data for a given platform from a JSON file that contains rows of
-    dicts, and map over each row to return a `PostData` object via `map_row_to_post`
-    function.
+    dicts, and map over each row to return a `PostData` object via the mapper
+    configured for the platform.
     """
 
-    mappers = importlib.import_module("post_roulette.mappers")
-    mapper_function = getattr(mappers, mapper_function_name)
+    mapper_function = _resolve_mapper(source_config)
 
-    with open(f"./data/{file_name}", "r") as f:
+    with open(f"./data/{source_config['data_file_name']}", "r") as f:
         file = f.read()
         data = json.loads(file)
 
@@ -0,0 +1,20 @@
+def repair_mojibake(text: str) -> str:
+    """
+    Repair text whose UTF-8 bytes were stored as latin-1 escaped code points, as
+    is the case for strings in Facebook data dumps.
+
+    Text that is not mojibaked is returned unchanged.
+    """
+
+    # pure ASCII text is byte-identical in latin-1 and UTF-8, so there is nothing
+    # to repair and the (C speed) scan is all the work done for most rows
+    if text.isascii():
+        return text
+
+    # re-interpret the code points as UTF-8 bytes in a single encode/decode round
+    # trip; if the text contains code points above 255, or its bytes are not valid
+    # UTF-8, it was not mojibaked to begin with
+    try:
+        return text.encode("latin-1").decode("utf-8")
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return text
@@ -1,3 +1,19 @@
-from .facebook_mapper import facebook_mapper
+from importlib import import_module
+from typing import Dict
 
-__all__ = ["facebook_mapper"]
+from ..types import MapRowToPost
+
+# mapper function names and the modules that define them, which are only
+# imported once a source using the mapper is loaded
+registry: Dict[str, str] = {
+    "facebook_mapper": "post_roulette.mappers.facebook_mapper",
+}
+
+
+def get_mapper(name: str) -> MapRowToPost:
+    """Get a registered mapper function by name, importing its module."""
+
+    return getattr(import_module(registry[name]), name)
+
+
+__all__ = ["get_mapper", "registry"]
@@ -1,4 +1,4 @@
-from ..lib import pretty_date_from_epoch_time
+from ..lib import pretty_date_from_epoch_time, repair_mojibake
 from ..types import PostData
 
 
@@ -11,6 +11,6 @@ def facebook_mapper(index: int, row: dict) -> PostData:
 
     return PostData(
         index=index,
-        content=content,
+        content=repair_mojibake(content),
         datetime=pretty_date_from_epoch_time(timestamp),
     )
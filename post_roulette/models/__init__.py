@@ -1,4 +1,5 @@
 from .cursors import Cursors
 from .posts import Posts
+from .shared_tinydb import LockingJSONStorage, SharedTinyDB
 
-__all__ = ["Cursors", "Posts"]
+__all__ = ["Cursors", "LockingJSONStorage", "Posts", "SharedTinyDB"]
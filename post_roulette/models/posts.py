@@ -1,6 +1,9 @@
-from tinydb import TinyDB, Query
+from typing import Iterable, List, Optional
+
+from tinydb import Query, TinyDB
 from tinydb.table import Document
-from typing import List, Optional
+
+from ..types import PostData
 
 
 class Posts:
@@ -46,6 +49,28 @@ class Posts:
 
         return len(inserted)
 
+    def create_many(self, source_name: str, posts: Iterable[PostData]) -> int:
+        """
+        Create posts for a source in a single write and return the number of
+        posts created.
+
+        Posts that are already saved are left as is.
+        """
+
+        saved_indices = {document["index"] for document in self.get_all(source_name)}
+        new_posts = [
+            dict(source_name=source_name, **post)
+            for post in posts
+            if post["index"] not in saved_indices
+        ]
+
+        if not new_posts:
+            return 0
+
+        inserted = self.table.insert_multiple(new_posts)
+
+        return len(inserted)
+
     def delete(self, source_name: str, index: int) -> int:
         """
         Delete a post by `index` for a given source if it exists and return
@@ -0,0 +1,196 @@
+import fcntl
+import json
+import os
+import stat
+import tempfile
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Mapping, Optional, Tuple
+
+from tinydb import Storage, TinyDB
+from tinydb.storages import touch
+from tinydb.table import Table
+
+Tables = Dict[str, Dict[str, Any]]
+
+
+class LockingJSONStorage(Storage):
+    """
+    JSON file storage for TinyDB that can be shared by several processes.
+
+    Writes hold an advisory lock on a sidecar lock file and replace the database
+    file atomically, so reads never take the lock: they always see a complete
+    snapshot of the file. Each write is merged into the latest snapshot on disk,
+    so concurrent sessions only overwrite each other's changes to the very same
+    document.
+    """
+
+    def __init__(self, path: str, create_dirs: bool = False, **kwargs) -> None:
+        super().__init__()
+
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self.kwargs = kwargs
+
+        touch(path, create_dirs=create_dirs)
+
+        # version (see `_version_of`) and text of the last snapshot read
+        self._version: Optional[Tuple[int, ...]] = None
+        self._text = ""
+
+        # recently read data along with the snapshot text it was parsed from, so
+        # a write can be diffed against the snapshot its data was derived from
+        self._reads: Deque[Tuple[Tables, str]] = deque(maxlen=4)
+
+    @staticmethod
+    def _version_of(stat: os.stat_result) -> Tuple[int, ...]:
+        """Version of a snapshot; every write replaces the file with a new one."""
+
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size)
+
+    def _read_text(self, fresh: bool = False) -> str:
+        """
+        Read the current snapshot, reusing the last read if the file has not been
+        replaced since, unless `fresh` is set.
+        """
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            version = self._version_of(os.fstat(f.fileno()))
+            if fresh or version != self._version:
+                self._text = f.read()
+                self._version = version
+
+        return self._text
+
+    def read(self) -> Optional[Tables]:
+        text = self._read_text()
+
+        # an empty file is an empty database, which TinyDB expects as `None`
+        if not text:
+            return None
+
+        data = json.loads(text)
+        self._reads.append((data, text))
+
+        return data
+
+    def write(self, data: Tables) -> None:
+        # TinyDB updates the very object it read, so use that read as the base
+        base_text = next(
+            (text for read, text in reversed(self._reads) if read is data),
+            self._text,
+        )
+        self._reads.clear()
+
+        with open(self.lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                current_text = self._read_text(fresh=True)
+
+                # another session wrote since the base snapshot
+                if current_text != base_text:
+                    data = _merge(
+                        json.loads(base_text) if base_text else {},
+                        data,
+                        json.loads(current_text) if current_text else {},
+                    )
+
+                self._replace(json.dumps(data, **self.kwargs))
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _replace(self, text: str) -> None:
+        """Atomically replace the database file with `text`."""
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            # `mkstemp` creates the file readable by its owner only, so keep the
+            # permissions of the database file being replaced
+            os.chmod(temp_path, stat.S_IMODE(os.stat(self.path).st_mode))
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        self._text = text
+        self._version = self._version_of(os.stat(self.path))
+
+
+def _merge(base: Tables, ours: Tables, theirs: Tables) -> Tables:
+    """
+    Apply the document changes between `base` and `ours` on top of `theirs`.
+
+    Documents changed by only one side keep that side's change. When both sides
+    changed the same document ours wins, except that a document we deleted is
+    kept if they changed it, and a document we inserted under an ID they also
+    inserted under moves to a new ID.
+    """
+
+    merged = theirs
+
+    for name in base.keys() | ours.keys():
+        base_table = base.get(name, {})
+        our_table = ours.get(name)
+
+        # table was dropped by us
+        if our_table is None:
+            merged.pop(name, None)
+            continue
+
+        table = merged.setdefault(name, {})
+
+        for doc_id in base_table.keys() | our_table.keys():
+            # deleted by us, unless they changed it in the meantime
+            if doc_id not in our_table:
+                if table.get(doc_id) == base_table[doc_id]:
+                    table.pop(doc_id)
+                continue
+
+            document = our_table[doc_id]
+            if base_table.get(doc_id) == document:
+                continue
+
+            if doc_id not in base_table and table.get(doc_id, document) != document:
+                doc_id = str(max(int(other_id) for other_id in table) + 1)
+
+            table[doc_id] = document
+
+    return merged
+
+
+class SharedTable(Table):
+    """
+    Table that does not cache query results or document IDs between operations,
+    as other sessions may have changed the database in the meantime.
+    """
+
+    default_query_cache_capacity = 0
+
+    def _update_table(self, updater: Callable[[Dict[int, Mapping]], None]) -> None:
+        def pinned_updater(table: Dict[int, Mapping]) -> None:
+            # allocate new IDs after the highest ID in the snapshot being updated,
+            # so an insert never takes the ID of a document in that snapshot
+            self._next_id = max(table, default=0) + 1  # type: ignore[assignment]
+            updater(table)
+
+        super()._update_table(pinned_updater)
+
+    def insert(self, document: Mapping) -> int:
+        if isinstance(document, self.document_class):
+            return super().insert(document)
+
+        # `Table.insert` allocates the ID before reading the snapshot to update,
+        # so allocate it within the update instead
+        return self.insert_multiple([document])[0]
+
+
+class SharedTinyDB(TinyDB):
+    """TinyDB database that several sessions can safely use at the same time."""
+
+    table_class = SharedTable
+    default_storage_class = LockingJSONStorage  # type: ignore[assignment]
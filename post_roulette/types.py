@@ -1,4 +1,4 @@
-from typing import Any, Callable, TypedDict
+from typing import Any, Callable, List, Literal, TypedDict
 
 
 class PostData(TypedDict):
@@ -10,7 +10,25 @@ class PostData(TypedDict):
 MapRowToPost = Callable[[int, Any], PostData]
 
 
-class SourceConfig(TypedDict):
+class MapperSpec(TypedDict, total=False):
+    # dotted paths into a row (e.g. "media.0.title"), tried in order until one
+    # resolves to a truthy value
+    content_paths: List[str]
+    timestamp_paths: List[str]
+    # unit of epoch timestamps, ignored when `timestamp_format` is given
+    timestamp_unit: Literal["s", "ms"]
+    # `strptime` format for timestamps stored as date strings
+    timestamp_format: str
+    # whether to pass content thru `repair_mojibake`
+    repair_text: bool
+
+
+class _SourceConfigRequired(TypedDict):
     name: str
-    mapper_function_name: str
     data_file_name: str
+
+
+class SourceConfig(_SourceConfigRequired, total=False):
+    # one of `mapper_function_name` or `mapper_spec` must be given
+    mapper_function_name: str
+    mapper_spec: MapperSpec
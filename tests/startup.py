@@ -0,0 +1,138 @@
+"""
+Measurements of the cold start of the `roulette` entry point, along with the
+budgets that `test_startup.py` enforces on them. Also reported by
+`benchmarks/bench_startup.py`.
+"""
+
+import json
+import os
+import pty
+import select
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Set, Tuple
+
+import post_roulette
+
+# cumulative `python -X importtime` time of `import post_roulette`
+IMPORT_BUDGET_US = 50_000
+# wall-clock time of `roulette <config> --help`
+HELP_BUDGET_S = 0.5
+# wall-clock time from launching the app on a small dump to its first frame
+FIRST_FRAME_BUDGET_S = 1.5
+
+# modules that are only needed past argument parsing, on specific code paths
+LAZY_MODULES = {
+    "curses",
+    "multiprocessing",
+    "tinydb",
+    "post_roulette.app",
+    "post_roulette.lib",
+    "post_roulette.mappers",
+    "post_roulette.models",
+}
+
+# root of the repo, so child processes import this copy of the package
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(post_roulette.__file__)))
+
+# run the entry point the way the `roulette` script does
+ENTRY_POINT = "import sys; from post_roulette import main; sys.exit(main())"
+
+
+def _env() -> dict:
+    return {**os.environ, "PYTHONPATH": REPO_ROOT, "TERM": "xterm"}
+
+
+def import_time() -> Tuple[int, Set[str]]:
+    """
+    Cumulative import time of `post_roulette` in microseconds, along with the
+    names of all modules imported with it.
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import post_roulette"],
+        capture_output=True,
+        text=True,
+        env=_env(),
+        check=True,
+    )
+
+    cumulative = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, _, total, name = (part.strip() for part in line.replace(":", "|").split("|"))
+        modules.add(name)
+        if name == "post_roulette":
+            cumulative = int(total)
+
+    return cumulative, modules
+
+
+def help_time() -> float:
+    """Wall-clock time of printing the CLI help, in seconds."""
+
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", ENTRY_POINT, "Facebook", "--help"],
+        capture_output=True,
+        env=_env(),
+        check=True,
+    )
+
+    return time.perf_counter() - start
+
+
+def first_frame_time(posts: int = 1000) -> float:
+    """
+    Wall-clock time from launching the app on a FB dump of `posts` posts until
+    its first frame is drawn, in seconds.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.mkdir(os.path.join(directory, "data"))
+        os.mkdir(os.path.join(directory, "db"))
+        rows = [
+            {"timestamp": 1500000000 + index, "data": [{"post": f"post {index}"}]}
+            for index in range(posts)
+        ]
+        with open(os.path.join(directory, "data", "fb_posts.json"), "w") as f:
+            json.dump(rows, f)
+
+        start = time.perf_counter()
+        pid, fd = pty.fork()
+        if pid == 0:
+            os.chdir(directory)
+            # the pty has no size, so give curses one that fits the app
+            env = {**_env(), "LINES": "40", "COLUMNS": "120"}
+            os.execve(
+                sys.executable, [sys.executable, "-c", ENTRY_POINT, "Facebook"], env
+            )
+
+        output = b""
+        elapsed = float("inf")
+        try:
+            while time.perf_counter() - start < 10:
+                ready, _, _ = select.select([fd], [], [], 0.01)
+                if ready:
+                    try:
+                        output += os.read(fd, 65536)
+                    except OSError:
+                        # the app exited without drawing a frame
+                        break
+                if b"POST ROULETTE" in output:
+                    elapsed = time.perf_counter() - start
+                    break
+        finally:
+            try:
+                os.write(fd, b"q")
+            except OSError:
+                pass
+            os.waitpid(pid, 0)
+            os.close(fd)
+
+        return elapsed
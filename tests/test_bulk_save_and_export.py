@@ -0,0 +1,111 @@
+import io
+import json
+import os
+import sys
+from datetime import date
+
+import pytest
+from tinydb import TinyDB
+from tinydb.storages import MemoryStorage
+
+from post_roulette import main
+from post_roulette.lib import export_posts, filter_posts
+from post_roulette.models import Posts, SharedTinyDB
+from post_roulette.types import PostData
+
+
+class CountingStorage(MemoryStorage):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        super().write(data)
+
+
+MAPPED_POSTS = [
+    PostData(index=0, content="first cat", datetime="01/01/2020, 10:00:00"),
+    PostData(index=1, content="a dog", datetime="01/02/2020, 10:00:00"),
+    PostData(index=2, content="second cat", datetime="01/03/2020, 10:00:00"),
+    PostData(index=3, content="third cat, 3", datetime="01/04/2020, 10:00:00"),
+]
+
+
+def indices(posts):
+    return [post["index"] for post in posts]
+
+
+def test_filter_posts():
+    assert indices(filter_posts(MAPPED_POSTS)) == [0, 1, 2, 3]
+    assert indices(filter_posts(MAPPED_POSTS, pattern="cat")) == [0, 2, 3]
+    assert indices(filter_posts(MAPPED_POSTS, since=date(2020, 1, 2))) == [1, 2, 3]
+    assert indices(filter_posts(MAPPED_POSTS, until=date(2020, 1, 2))) == [0, 1]
+    assert indices(filter_posts(MAPPED_POSTS, "cat", start=1, end=3)) == [2]
+
+
+def test_create_many_writes_once():
+    db = TinyDB(storage=CountingStorage)
+    posts = Posts(db)
+    posts.create("test", **MAPPED_POSTS[0])
+    writes = db.storage.writes
+
+    assert posts.create_many("test", MAPPED_POSTS) == 3
+    assert db.storage.writes == writes + 1
+    assert indices(posts.get_all("test")) == [0, 1, 2, 3]
+
+    # nothing left to save, so nothing is written
+    assert posts.create_many("test", MAPPED_POSTS) == 0
+    assert db.storage.writes == writes + 1
+
+
+def test_export_posts():
+    documents = [dict(source_name="test", **post) for post in MAPPED_POSTS]
+
+    jsonl = io.StringIO()
+    assert export_posts(documents, jsonl, "jsonl") == 4
+    assert [json.loads(line) for line in jsonl.getvalue().splitlines()] == documents
+
+    csv = io.StringIO()
+    export_posts(documents, csv, "csv")
+    lines = csv.getvalue().splitlines()
+    assert lines[0] == "source_name,index,datetime,content"
+    assert lines[4] == 'test,3,"01/04/2020, 10:00:00","third cat, 3"'
+
+    markdown = io.StringIO()
+    export_posts(documents[:1], markdown, "md")
+    assert markdown.getvalue() == ("## test #0 – 01/01/2020, 10:00:00\n\nfirst cat\n\n")
+
+
+def test_invalid_regex_is_a_usage_error(tmp_path, monkeypatch, capsys):
+    # there is no data dump here, so the error must come before loading one
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["roulette", "Facebook", "save", "--regex", "("])
+
+    with pytest.raises(SystemExit) as error:
+        main()
+
+    assert error.value.code == 2
+    assert "invalid regex" in capsys.readouterr().err
+
+
+def test_export_to_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.mkdir("db")
+    Posts(SharedTinyDB("./db/db.json")).create_many("facebook", MAPPED_POSTS[:2])
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["roulette", "Facebook", "export", "--format", "csv", "--output", "out.csv"],
+    )
+
+    main()
+
+    with open("out.csv", newline="") as f:
+        lines = f.read().split("\r\n")
+    assert lines == [
+        "source_name,index,datetime,content",
+        'facebook,0,"01/01/2020, 10:00:00",first cat',
+        'facebook,1,"01/02/2020, 10:00:00",a dog',
+        "",
+    ]
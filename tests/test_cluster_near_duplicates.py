@@ -0,0 +1,54 @@
+import os
+
+from post_roulette.lib import cluster_near_duplicates
+
+ORIGINAL = (
+    "went down to the river this morning and watched the herons fish "
+    + "for an hour before the rain came in over the hills"
+)
+EDITED = ORIGINAL.replace("an hour", "two hours")
+UNRELATED = (
+    "new recipe for lentil soup with cumin, lemon and a lot of garlic "
+    + "turned out better than expected, will make it again"
+)
+
+CONTENTS = [ORIGINAL, UNRELATED, "", EDITED, ORIGINAL, "", UNRELATED.upper()]
+
+
+def test_clusters_near_duplicates(tmp_path):
+    clusters = cluster_near_duplicates("test", CONTENTS, cache_dir=str(tmp_path))
+
+    # edited and verbatim reposts collapse onto the first post, posts without
+    # text are never clustered
+    assert clusters == [0, 1, 2, 0, 0, 5, 1]
+
+
+def test_caches_signatures_per_dump(tmp_path):
+    cluster_near_duplicates("test", CONTENTS, cache_dir=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 1
+
+    cached = cluster_near_duplicates("test", CONTENTS, cache_dir=str(tmp_path))
+    assert cached == [0, 1, 2, 0, 0, 5, 1]
+
+    # a changed dump replaces the stale cache
+    cluster_near_duplicates("test", CONTENTS[:3], cache_dir=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_workers_match_single_process():
+    contents = CONTENTS * 2000
+    assert cluster_near_duplicates(
+        "test", contents, workers=2, cache_dir=None
+    ) == cluster_near_duplicates("test", contents, cache_dir=None)
+
+
+def test_recomputes_corrupt_cache(tmp_path):
+    cluster_near_duplicates("test", CONTENTS, cache_dir=str(tmp_path))
+    (cache_file,) = tmp_path.iterdir()
+
+    # a cache file cut short, as by an interrupted write
+    cache_file.write_bytes(cache_file.read_bytes()[:-3])
+    clusters = cluster_near_duplicates("test", CONTENTS, cache_dir=str(tmp_path))
+
+    assert clusters == [0, 1, 2, 0, 0, 5, 1]
+    assert cache_file.stat().st_size == len(CONTENTS) * 32 * 4
@@ -0,0 +1,66 @@
+import pytest
+
+from post_roulette.config import source_configs
+from post_roulette.lib import compile_mapper_spec, pretty_date_from_epoch_time
+from post_roulette.mappers.facebook_mapper import facebook_mapper
+from post_roulette.types import MapperSpec
+
+FB_SPEC = MapperSpec(
+    content_paths=["data.0.post"], timestamp_paths=["timestamp"], repair_text=True
+)
+
+
+def test_matches_hand_written_mapper():
+    mapper = compile_mapper_spec(FB_SPEC)
+    rows = [
+        {"timestamp": 1500000000, "data": [{"post": "hello"}]},
+        # "café 🙂" as FB dumps mojibake it
+        {
+            "timestamp": 1500000000,
+            "data": [{"post": "caf\u00c3\u00a9 \u00f0\u009f\u0099\u0082"}],
+        },
+        {"timestamp": 1500000000, "data": []},
+        {"data": [{"update_timestamp": 1}]},
+        {},
+    ]
+
+    for index, row in enumerate(rows):
+        assert mapper(index, row) == facebook_mapper(index, row)
+
+    assert mapper(1, rows[1])["content"] == "café 🙂"
+
+
+def test_falls_back_thru_paths():
+    mapper = compile_mapper_spec(source_configs["Instagram"]["mapper_spec"])
+    single = {"media": [{"title": "caption", "creation_timestamp": 1500000000}]}
+    multi = {"title": "album", "creation_timestamp": 1500000000, "media": []}
+
+    assert mapper(0, single)["content"] == "caption"
+    assert mapper(1, multi)["content"] == "album"
+    assert mapper(2, {})["content"] == ""
+
+
+def test_timestamp_units():
+    date = pretty_date_from_epoch_time(1500000000)
+    seconds = compile_mapper_spec(MapperSpec(timestamp_paths=["t"]))
+    millis = compile_mapper_spec(MapperSpec(timestamp_paths=["t"], timestamp_unit="ms"))
+
+    assert seconds(0, {"t": 1500000000})["datetime"] == date
+    assert millis(0, {"t": 1500000000123})["datetime"] == date
+
+    with pytest.raises(ValueError):
+        compile_mapper_spec(MapperSpec(timestamp_unit="h"))  # type: ignore
+
+
+def test_timestamp_format():
+    mapper = compile_mapper_spec(source_configs["Twitter"]["mapper_spec"])
+    row = {"tweet": {"full_text": "hi", "created_at": "Fri Jul 14 02:40:00 +0000 2017"}}
+
+    assert mapper(0, row) == dict(
+        index=0, content="hi", datetime=pretty_date_from_epoch_time(1500000000)
+    )
+
+
+def test_repair_text():
+    mapper = compile_mapper_spec(MapperSpec(content_paths=["c"], repair_text=True))
+    assert mapper(0, {"c": "cafÃ©"})["content"] == "café"
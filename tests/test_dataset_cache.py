@@ -0,0 +1,191 @@
+import json
+import os
+
+import pytest
+from tinydb import TinyDB
+from tinydb.storages import MemoryStorage
+
+from post_roulette.app import App
+from post_roulette.config import source_configs
+from post_roulette.lib import DatasetCache, load_and_map_data
+from post_roulette.models import Cursors, Posts
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Run in a directory with small FB and Instagram dumps."""
+
+    monkeypatch.chdir(tmp_path)
+    os.mkdir("data")
+
+    fb_rows = [
+        {"timestamp": index, "data": [{"post": f"fb {index}"}]} for index in range(50)
+    ]
+    ig_rows = [
+        {"title": f"ig {index}", "creation_timestamp": index} for index in range(30)
+    ]
+    with open("data/fb_posts.json", "w") as f:
+        json.dump(fb_rows, f)
+    with open("data/ig_posts.json", "w") as f:
+        json.dump(ig_rows, f)
+
+    return tmp_path
+
+
+def test_evicts_least_recently_used_to_snapshot(data_dir):
+    facebook = load_and_map_data(source_configs["Facebook"])
+
+    # a budget that only fits one dataset at a time
+    datasets = DatasetCache(source_configs, 1, "./cache")
+
+    assert datasets.get("Facebook") == facebook
+    assert datasets.get("Facebook") is datasets.get("Facebook")
+
+    datasets.get("Instagram")
+    assert "Facebook" not in datasets and "Instagram" in datasets
+    assert len(os.listdir("./cache")) == 1
+
+
+def test_snapshot_round_trips(data_dir):
+    # evicted datasets come back from their snapshot
+    datasets = DatasetCache(source_configs, 1, "./cache")
+    facebook = datasets.get("Facebook")
+    datasets.get("Instagram")
+
+    assert datasets.get("Facebook") == facebook
+    assert datasets.get("Facebook") is not facebook
+
+
+def test_prefetch_never_evicts(data_dir):
+    datasets = DatasetCache(source_configs, 1, "./cache")
+    datasets.get("Facebook")
+
+    datasets.prefetch("Instagram")
+    loading = datasets._loading.get("Instagram")
+    if loading is not None:
+        loading.join()
+
+    # Instagram does not fit in the budget, so it only got snapshotted
+    assert "Facebook" in datasets and "Instagram" not in datasets
+    assert len(os.listdir("./cache")) == 1
+
+
+def test_app_switches_sources(data_dir):
+    db = TinyDB(storage=MemoryStorage)
+    datasets = DatasetCache(source_configs, 2**30, "./cache")
+    app = App(["Facebook", "Instagram"], Cursors(db), Posts(db), datasets)
+
+    app.view.next_post()
+    assert app.source_name == "facebook" and app.view.cursor == 1
+
+    app.switch_source()
+    assert app.source_name == "instagram" and app.view.cursor == 0
+    assert app.view.current_post_row["content"] == "ig 0"
+
+    # each source keeps its own position
+    app.switch_source()
+    assert app.source_name == "facebook" and app.view.cursor == 1
+    assert app.view.current_post_row["content"] == "fb 1"
+
+
+class FakeWindow:
+    """Stand-in for a curses window that replays keys and records clears."""
+
+    def __init__(self, keys: str) -> None:
+        self.keys = [ord(key) for key in keys]
+        self.clears = 0
+
+    def getch(self) -> int:
+        return self.keys.pop(0)
+
+    def clear(self) -> None:
+        self.clears += 1
+
+    def subwin(self, *args) -> "FakeWindow":
+        return self
+
+    def box(self) -> None:
+        pass
+
+    def addstr(self, *args) -> None:
+        pass
+
+    def addnstr(self, *args) -> None:
+        pass
+
+
+def test_app_switches_sources_from_last_post(data_dir):
+    db = TinyDB(storage=MemoryStorage)
+    datasets = DatasetCache(source_configs, 2**30, "./cache")
+    app = App(["Facebook", "Instagram"], Cursors(db), Posts(db), datasets)
+
+    # walk to the last FB post, switch to Instagram and back, then quit; any
+    # cursor warning would consume one of these keys and break the sequence
+    window = FakeWindow("M" * 49 + "SSQ")
+    app._render(window)  # type: ignore[arg-type]
+
+    assert window.keys == []
+    assert app.source_name == "facebook" and app.view.cursor == 49
+    # one clear per main view frame, none for a warning
+    assert window.clears == 52
+
+
+def test_snapshot_is_specific_to_mapper(data_dir):
+    datasets = DatasetCache(source_configs, 1, "./cache")
+    instagram = datasets.get("Instagram")
+    datasets.get("Facebook")
+
+    # a snapshot mapped with a previous version of the mapper spec is not used
+    edited_configs = {
+        **source_configs,
+        "Instagram": {
+            **source_configs["Instagram"],
+            "mapper_spec": {
+                **source_configs["Instagram"]["mapper_spec"],
+                "content_paths": ["media.0.title"],
+            },
+        },
+    }
+    edited_datasets = DatasetCache(edited_configs, 1, "./cache")
+    assert edited_datasets._snapshot_path("Instagram") != datasets._snapshot_path(
+        "Instagram"
+    )
+    assert edited_datasets.get("Instagram") != instagram
+
+
+def test_app_switches_to_source_with_stale_cursor(data_dir):
+    db = TinyDB(storage=MemoryStorage)
+    cursors = Cursors(db)
+    # saved for a previous, longer Instagram dump
+    cursors.set_value("instagram", 40)
+
+    datasets = DatasetCache(source_configs, 2**30, "./cache")
+    app = App(["Facebook", "Instagram"], cursors, Posts(db), datasets)
+    app.switch_source()
+    assert app.source_name == "instagram" and not app.view.is_cursor_in_range
+
+    # the cursor warning takes the reset key, then the main view the quit key
+    window = FakeWindow("CQ")
+    app._render(window)  # type: ignore[arg-type]
+
+    assert window.keys == []
+    assert app.view.cursor == 0 and app.view.post.current_page.startswith("ig 0")
+
+
+def test_corrupt_snapshot_falls_back_to_dump(data_dir):
+    datasets = DatasetCache(source_configs, 1, "./cache")
+    facebook = datasets.get("Facebook")
+    datasets.get("Instagram")
+
+    # a snapshot cut short, as by a full disk
+    snapshot_path = datasets._snapshot_path("Facebook")
+    with open(snapshot_path, "rb") as f:
+        snapshot = f.read()
+    with open(snapshot_path, "wb") as f:
+        f.write(snapshot[: len(snapshot) // 2])
+
+    assert datasets.get("Facebook") == facebook
+    # the corrupt snapshot was dropped, and Instagram evicted to its own
+    assert os.listdir("./cache") == [
+        os.path.basename(datasets._snapshot_path("Instagram"))
+    ]
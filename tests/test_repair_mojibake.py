@@ -0,0 +1,43 @@
+import json
+
+from post_roulette.lib import repair_mojibake
+from post_roulette.mappers.facebook_mapper import facebook_mapper
+
+# intended text for each kind of post that FB dumps mojibake
+CORPUS = [
+    "plain ascii post",
+    "café au lait, déjà vu, naïve façade",
+    "سلام دنیا، این یک پست فارسی است",
+    "emoji 🎉🔥 and a flag 🇮🇷",
+    "mixed: Grüße из Москвы 東京",
+    "",
+]
+
+
+def mojibake(text: str) -> str:
+    """Mangle text the way FB dumps do: UTF-8 bytes as latin-1 code points."""
+    return text.encode("utf-8").decode("latin-1")
+
+
+def test_repairs_corpus():
+    for text in CORPUS:
+        assert repair_mojibake(mojibake(text)) == text
+
+
+def test_repairs_json_escaped_dump_text():
+    # "café 🎉" as it appears in the raw JSON of a FB dump
+    raw = '"caf\\u00c3\\u00a9 \\u00f0\\u009f\\u008e\\u0089"'
+    assert repair_mojibake(json.loads(raw)) == "café 🎉"
+
+
+def test_leaves_intact_text_untouched():
+    for text in CORPUS:
+        assert repair_mojibake(text) == text
+
+    # latin-1 text that is not valid UTF-8 once encoded
+    assert repair_mojibake("résumé") == "résumé"
+
+
+def test_facebook_mapper_repairs_content():
+    row = {"timestamp": 0, "data": [{"post": mojibake(CORPUS[2])}]}
+    assert facebook_mapper(0, row)["content"] == CORPUS[2]
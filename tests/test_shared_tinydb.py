@@ -0,0 +1,86 @@
+import os
+import random
+from multiprocessing import Pool
+
+from post_roulette.app.state_models import ViewState
+from post_roulette.models import Cursors, Posts, SharedTinyDB
+from post_roulette.types import PostData
+
+WRITERS = 4
+ACTIONS = 200
+MAPPED_POSTS = [
+    PostData(index=index, content=f"post {index}", datetime="") for index in range(20)
+]
+
+
+def run_session(args):
+    """Jog thru and toggle posts at random, returning the expected end state."""
+
+    path, source_name = args
+    rng = random.Random(source_name)
+    view = ViewState(
+        source_name,
+        Cursors(SharedTinyDB(path)),
+        Posts(SharedTinyDB(path)),
+        MAPPED_POSTS,
+    )
+    saved = set()
+
+    for _ in range(ACTIONS):
+        action = rng.choice(["next", "previous", "random", "toggle"])
+
+        if action == "next":
+            view.next_post()
+        elif action == "previous":
+            view.previous_post()
+        elif action == "random":
+            view.random_post()
+        else:
+            saved ^= {view.cursor}
+            view.toggle_post()
+
+    return source_name, view.cursor, saved
+
+
+def test_concurrent_sessions_lose_nothing(tmp_path):
+    path = str(tmp_path / "db.json")
+    sessions = [(path, f"source {writer}") for writer in range(WRITERS)]
+
+    with Pool(WRITERS) as pool:
+        results = pool.map(run_session, sessions)
+
+    db = SharedTinyDB(path)
+    cursors, posts = Cursors(db), Posts(db)
+    for source_name, cursor, saved in results:
+        assert cursors.get_value(source_name) == cursor
+        assert {doc["index"] for doc in posts.get_all(source_name)} == saved
+
+    assert len(db.table("cursor")) == WRITERS
+    assert len(db.table("posts")) == sum(len(saved) for *_, saved in results)
+
+
+def test_merges_interleaved_writes(tmp_path):
+    path = str(tmp_path / "db.json")
+    first, second = Posts(SharedTinyDB(path)), Posts(SharedTinyDB(path))
+
+    first.create("a", 0, "zero", "")
+    assert first.get("a", 0) is not None
+
+    # both sessions insert a new document under the same ID
+    second.create("b", 0, "zero", "")
+    first.create("a", 1, "one", "")
+    second.delete("a", 0)
+
+    assert [doc["index"] for doc in first.get_all("a")] == [1]
+    assert [doc["index"] for doc in second.get_all("b")] == [0]
+    assert len(SharedTinyDB(path).table("posts")) == 2
+
+
+def test_keeps_file_permissions(tmp_path):
+    path = str(tmp_path / "db.json")
+    posts = Posts(SharedTinyDB(path))
+    os.chmod(path, 0o664)
+
+    posts.create("a", 0, "zero", "")
+
+    assert os.stat(path).st_mode & 0o777 == 0o664
@@ -0,0 +1,24 @@
+from .startup import (
+    FIRST_FRAME_BUDGET_S,
+    HELP_BUDGET_S,
+    IMPORT_BUDGET_US,
+    LAZY_MODULES,
+    first_frame_time,
+    help_time,
+    import_time,
+)
+
+
+def test_import_is_lazy_and_within_budget():
+    cumulative, modules = import_time()
+
+    assert LAZY_MODULES & modules == set()
+    assert cumulative < IMPORT_BUDGET_US
+
+
+def test_help_within_budget():
+    assert help_time() < HELP_BUDGET_S
+
+
+def test_first_frame_within_budget():
+    assert first_frame_time() < FIRST_FRAME_BUDGET_S
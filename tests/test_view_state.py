@@ -0,0 +1,52 @@
+from tinydb import TinyDB
+from tinydb.storages import MemoryStorage
+
+from post_roulette.app.state_models import ViewState
+from post_roulette.models import Cursors, Posts
+from post_roulette.types import PostData
+
+
+def make_view_state(count: int, clusters=None, cursor: int = 0) -> ViewState:
+    db = TinyDB(storage=MemoryStorage)
+    cursors = Cursors(db)
+    cursors.set_value("test", cursor)
+    mapped_posts = [
+        PostData(index=index, content=f"post {index}", datetime="")
+        for index in range(count)
+    ]
+    return ViewState("test", cursors, Posts(db), mapped_posts, clusters)
+
+
+def test_jogs_thru_all_posts():
+    view = make_view_state(3)
+
+    view.next_post()
+    view.next_post()
+    assert view.cursor == 2 and not view.has_next_post
+
+    view.previous_post()
+    assert view.cursor == 1 and view.has_previous_post
+
+
+def test_skips_near_duplicates():
+    view = make_view_state(6, clusters=[0, 1, 0, 3, 1, 3])
+
+    view.next_post()
+    assert view.cursor == 1
+    view.next_post()
+    assert view.cursor == 3 and not view.has_next_post
+
+    view.previous_post()
+    assert view.cursor == 1
+
+    for _ in range(20):
+        view.random_post()
+        assert view.cursor in (0, 1, 3)
+
+
+def test_starts_from_representative():
+    # cursor saved by a session without near-duplicate clusters
+    view = make_view_state(6, clusters=[0, 1, 0, 3, 1, 3], cursor=4)
+
+    assert view.cursor == 1
+    assert view.post.current_page.startswith("post 1")